@@ -12,34 +12,82 @@ Output format is compatible with the Site Survey Tool v4.1 importer.
 import os
 import sys
 import time
-import glob
+import array
+import fcntl
+import queue
 import serial
+import termios
 import argparse
-from datetime import datetime, timedelta
+import signal
+import selectors
+import threading
+from datetime import datetime
 
-# Iridium ERA2 epoch: May 11, 2014, 14:23:55 UTC
-IRIDIUM_ERA2_EPOCH = datetime(2014, 5, 11, 14, 23, 55)
-IRIDIUM_TICK_MS = 90  # Each tick is 90 milliseconds
+# Iridium ERA2 epoch: May 11, 2014, 14:23:55 UTC (as Unix time in ns)
+IRIDIUM_ERA2_EPOCH_NS = 1_399_818_235_000_000_000
+IRIDIUM_TICK_NS = 90_000_000  # Each tick is 90 milliseconds
+
+# How often to resync with Iridium time while logging (5 minutes)
+TIME_SYNC_INTERVAL_NS = 300_000_000_000
+
+# After Ctrl+C/SIGTERM, how long to wait for the rest of a partial line
+SHUTDOWN_DRAIN_NS = 500_000_000
+
+# Serial receive buffer, allocated once. Also the longest line we accept;
+# anything longer without a newline is line noise and gets dropped
+RX_BUFFER_SIZE = 8192
+
+# Raspberry Pi GPIO serial ports, by /dev name
+GPIO_SERIAL_PORTS = {
+    'serial0': 'Primary GPIO serial (pins 14/15)',
+    'ttyAMA0': 'PL011 UART',
+    'ttyS0': 'Mini UART',
+}
+
+# serial_struct flag asking the tty driver to push received bytes at once
+ASYNC_LOW_LATENCY = 0x2000
+
+# Unsolicited result code prefix for CIER indicator events
+CIEV_PREFIX = b"+CIEV:"
+
+# Final result codes that end an AT command response
+FINAL_RESULT_CODES = (b"OK", b"ERROR", b"READY")
+
+# How long to wait for the final result code after a match_prefix line
+RESPONSE_TAIL_TIMEOUT = 0.5  # seconds
+
+# Bytes dropped from logged lines (same as decoding as ASCII with errors ignored)
+NON_ASCII = bytes(range(0x80, 0x100))
+
+# Log writer: max batches (one per serial read) buffered in memory, and
+# max lines per writev() call
+LOG_QUEUE_SIZE = 4096
+LOG_IOV_MAX = 1024  # IOV_MAX on Linux
 
 
 def find_serial_ports():
     """Discover available serial ports on the system."""
     ports = []
 
+    # One pass over /dev picks up both USB serial devices and the
+    # Raspberry Pi GPIO serial ports
+    usb_ports = []
+    gpio_names = set()
+    with os.scandir('/dev') as entries:
+        for entry in entries:
+            if entry.name.startswith(('ttyUSB', 'ttyACM')):
+                usb_ports.append(entry.path)
+            elif entry.name in GPIO_SERIAL_PORTS:
+                gpio_names.add(entry.name)
+
     # USB serial devices
-    usb_ports = glob.glob('/dev/ttyUSB*') + glob.glob('/dev/ttyACM*')
-    for port in usb_ports:
+    for port in sorted(usb_ports):
         ports.append({'path': port, 'type': 'USB', 'description': f'USB Serial ({os.path.basename(port)})'})
 
     # Raspberry Pi GPIO serial
-    gpio_ports = [
-        ('/dev/serial0', 'Primary GPIO serial (pins 14/15)'),
-        ('/dev/ttyAMA0', 'PL011 UART'),
-        ('/dev/ttyS0', 'Mini UART'),
-    ]
-    for path, desc in gpio_ports:
-        if os.path.exists(path):
-            ports.append({'path': path, 'type': 'GPIO', 'description': desc})
+    for name, desc in GPIO_SERIAL_PORTS.items():
+        if name in gpio_names:
+            ports.append({'path': f'/dev/{name}', 'type': 'GPIO', 'description': desc})
 
     return ports
 
@@ -63,24 +111,25 @@ def find_storage_locations():
         'description': f'Home directory ({home})'
     })
 
-    # Check for mounted storage (SD cards, USB drives)
+    # Check for mounted storage (SD cards, USB drives). scandir() hands back
+    # the entry type with each name, so most is_dir() checks need no stat
     mount_points = ['/media', '/mnt', '/run/media']
     for mount_base in mount_points:
-        if os.path.exists(mount_base):
-            try:
-                for user_dir in os.listdir(mount_base):
-                    user_path = os.path.join(mount_base, user_dir)
-                    if os.path.isdir(user_path):
-                        for device in os.listdir(user_path):
-                            device_path = os.path.join(user_path, device)
-                            if os.path.isdir(device_path) and os.access(device_path, os.W_OK):
+        try:
+            with os.scandir(mount_base) as user_dirs:
+                for user_dir in user_dirs:
+                    if not user_dir.is_dir():
+                        continue
+                    with os.scandir(user_dir.path) as devices:
+                        for device in devices:
+                            if device.is_dir() and os.access(device.path, os.W_OK):
                                 locations.append({
-                                    'path': device_path,
+                                    'path': device.path,
                                     'type': 'Removable',
-                                    'description': f'Mounted storage: {device}'
+                                    'description': f'Mounted storage: {device.name}'
                                 })
-            except PermissionError:
-                pass
+        except (FileNotFoundError, PermissionError):
+            pass
 
     return locations
 
@@ -193,8 +242,8 @@ def select_baud_rate():
     return 19200
 
 
-def iridium_time_to_datetime(hex_value):
-    """Convert Iridium system time (AT-MSSTM hex response) to datetime.
+def iridium_time_to_ns(hex_value):
+    """Convert Iridium system time (AT-MSSTM hex response) to Unix time in ns.
 
     MSSTM returns hex value representing 90ms ticks since Iridium ERA2 epoch.
     """
@@ -202,49 +251,86 @@ def iridium_time_to_datetime(hex_value):
         # Convert from hex to decimal (count of 90ms intervals)
         interval_count = int(hex_value.strip(), 16)
 
-        # Calculate total milliseconds since epoch
-        total_milliseconds = interval_count * IRIDIUM_TICK_MS
-
-        # Create timedelta and add to epoch
-        time_delta = timedelta(milliseconds=total_milliseconds)
-        decoded_time = IRIDIUM_ERA2_EPOCH + time_delta
-
-        return decoded_time
+        return IRIDIUM_ERA2_EPOCH_NS + interval_count * IRIDIUM_TICK_NS
     except (ValueError, TypeError):
         return None
 
 
-def send_command(ser, command, timeout=2):
-    """Send AT command and return response lines."""
-    ser.reset_input_buffer()
+def send_command(ser, command, timeout=2, on_unsolicited=None, match_prefix=None,
+                 interrupt_fd=None):
+    """Send AT command and return response lines.
+
+    Reading stops at the final result code (OK/ERROR/READY). When
+    match_prefix (bytes) is given, a line starting with it ends the read
+    early: immediately while logging, otherwise after at most
+    RESPONSE_TAIL_TIMEOUT more for the final result code.
+
+    By default anything already in the input buffer is discarded first.
+    When on_unsolicited is given (i.e. while CIER logging is running), the
+    buffer is left alone and any +CIEV: lines read while waiting for the
+    response are passed to it instead of being dropped.
+
+    If interrupt_fd becomes readable (the logger's signal wakeup pipe),
+    waiting stops and whatever has been read so far is returned.
+    """
+    if on_unsolicited is None:
+        ser.reset_input_buffer()
     ser.write(f"{command}\r".encode())
-    time.sleep(0.2)
 
     response_lines = []
-    end_time = time.time() + timeout
-
-    while time.time() < end_time:
-        if ser.in_waiting:
-            line = ser.readline().decode('ascii', errors='ignore').strip()
-            if line:
-                response_lines.append(line)
-                if line in ['OK', 'ERROR', 'READY']:
+    end_time = time.monotonic() + timeout
+
+    # Wait for the port to become readable rather than sleeping on a fixed
+    # schedule, so each line is picked up as soon as the modem sends it
+    with selectors.DefaultSelector() as sel:
+        sel.register(ser.fileno(), selectors.EVENT_READ)
+        if interrupt_fd is not None:
+            sel.register(interrupt_fd, selectors.EVENT_READ)
+
+        while True:
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                break
+            ready = sel.select(remaining)
+            if not ready or any(key.fd == interrupt_fd for key, _ in ready):
+                break
+
+            # Lines are matched as bytes and only decoded when kept.
+            # readline() never reads past the newline, so whatever follows
+            # the response stays in the port for the logging loop
+            raw = ser.readline().strip()
+            if not raw:
+                continue
+            if on_unsolicited and raw.startswith(CIEV_PREFIX):
+                on_unsolicited(raw.decode('ascii', errors='ignore'))
+                continue
+            response_lines.append(raw.decode('ascii', errors='ignore'))
+            if raw in FINAL_RESULT_CODES:
+                break
+            if match_prefix and raw.startswith(match_prefix):
+                # The logging loop ignores the trailing OK, so stop here.
+                # Otherwise it must be read now, or the next command's
+                # buffer reset may miss it and take it as its own reply
+                if on_unsolicited:
                     break
-        else:
-            time.sleep(0.05)
+                end_time = min(end_time, time.monotonic() + RESPONSE_TAIL_TIMEOUT)
 
     return response_lines
 
 
-def get_iridium_time(ser):
+def get_iridium_time(ser, on_unsolicited=None, interrupt_fd=None):
     """Get current time from Iridium network."""
-    response = send_command(ser, "AT-MSSTM", timeout=5)
+    response = send_command(
+        ser, "AT-MSSTM", timeout=5,
+        on_unsolicited=on_unsolicited, match_prefix=b"-MSSTM:",
+        interrupt_fd=interrupt_fd
+    )
 
     for line in response:
         if "-MSSTM:" in line:
             hex_time = line.split(":")[1].strip()
             if hex_time and hex_time != "no network service":
-                return iridium_time_to_datetime(hex_time)
+                return iridium_time_to_ns(hex_time)
 
     return None
 
@@ -254,9 +340,7 @@ def setup_modem(ser):
     print("\nInitializing modem...")
 
     # Disable echo first
-    ser.write(b"ATE0\r")
-    time.sleep(0.5)
-    ser.reset_input_buffer()
+    send_command(ser, "ATE0")
 
     # Basic AT test
     response = send_command(ser, "AT")
@@ -267,13 +351,14 @@ def setup_modem(ser):
     print("  OK Modem responding")
 
     # Get Iridium time
-    iridium_dt = get_iridium_time(ser)
-    if iridium_dt:
-        print(f"  OK Iridium time: {iridium_dt.strftime('%Y-%m-%d %H:%M:%S')}")
+    iridium_ns = get_iridium_time(ser)
+    if iridium_ns:
+        iridium_utc = time.gmtime(iridium_ns // 1_000_000_000)
+        print(f"  OK Iridium time: {time.strftime('%Y-%m-%d %H:%M:%S', iridium_utc)}")
     else:
         print("  !! Could not get Iridium time (using system time)")
 
-    return iridium_dt
+    return iridium_ns
 
 
 def enable_cier(ser):
@@ -282,6 +367,97 @@ def enable_cier(ser):
     return "OK" in response
 
 
+def write_lines(fd, lines):
+    """Write a list of byte strings to fd, one writev() call per LOG_IOV_MAX lines."""
+    for i in range(0, len(lines), LOG_IOV_MAX):
+        group = lines[i:i + LOG_IOV_MAX]
+        written = os.writev(fd, group)
+
+        # Finish off a short write (e.g. disk nearly full) with plain writes
+        if written < sum(map(len, group)):
+            remaining = memoryview(b''.join(group))[written:]
+            while remaining:
+                remaining = remaining[os.write(fd, remaining):]
+
+
+def format_events(lines, ts_prefix):
+    """Return timestamped log lines (bytes) for a list of raw CIEV lines.
+
+    Works on bytes throughout: line noise outside ASCII is deleted and the
+    trailing CR dropped, without a decode/strip/encode round trip.
+    """
+    return [
+        ts_prefix + line.translate(None, NON_ASCII).rstrip(b"\r\n") + b"\n"
+        for line in lines
+    ]
+
+
+def log_writer(fd, log_queue, errors):
+    """Write queued batches of log lines to fd until a None sentinel arrives.
+
+    Runs on a background thread. Whatever has queued up while the previous
+    batch was being written goes out in a single write_lines() call. Write
+    failures are appended to errors for the logging loop to report.
+    """
+    try:
+        while True:
+            events = log_queue.get()
+
+            # Grab everything else that's already waiting
+            batch = []
+            while events is not None:
+                batch.extend(events)
+                try:
+                    events = log_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                write_lines(fd, batch)
+
+            if events is None:
+                return
+    except IOError as e:
+        errors.append(e)
+
+
+def enable_low_latency(ser):
+    """Turn on ASYNC_LOW_LATENCY for the serial port.
+
+    Returns True only if this call turned the flag on. A port that already
+    had it set (by setserial, a udev rule, ...) is left alone and reported
+    as False, so close_port() won't clear someone else's setting.
+    """
+    buf = array.array('i', [0] * 32)
+    try:
+        fcntl.ioctl(ser.fileno(), termios.TIOCGSERIAL, buf)
+    except OSError:
+        return False  # Port doesn't support serial_struct (pty, some UARTs)
+
+    if buf[4] & ASYNC_LOW_LATENCY:
+        return False
+
+    try:
+        ser.set_low_latency_mode(True)
+    except (ValueError, NotImplementedError):
+        return False
+    return True
+
+
+def close_port(ser, low_latency):
+    """Close the serial port, first clearing ASYNC_LOW_LATENCY if we set it.
+
+    The flag lives in the driver and outlasts the process, so it would
+    otherwise stay on for every later user of the adapter.
+    """
+    if low_latency:
+        try:
+            ser.set_low_latency_mode(False)
+        except ValueError:
+            pass
+    ser.close()
+
+
 def check_system_time():
     """Check if system time looks reasonable and warn if not."""
     now = datetime.now()
@@ -323,38 +499,51 @@ def run_logger(port, output_file, baud_rate=19200):
 
     print(f"Connected to {port}")
 
+    # pyserial already puts the port in raw, non-blocking mode. Also ask the
+    # driver to push received bytes to us immediately instead of batching
+    # them (mainly helps USB serial adapters); not every port supports it
+    low_latency = enable_low_latency(ser)
+
     # Setup modem and get time (but don't enable CIER yet)
-    iridium_dt = setup_modem(ser)
-    if iridium_dt is None and not send_command(ser, "AT"):
+    iridium_ns = setup_modem(ser)
+    if iridium_ns is None and not send_command(ser, "AT"):
         # setup_modem returns None on failure, but also None if just no time
         # Double-check modem is responsive
-        ser.close()
+        close_port(ser, low_latency)
         return False
 
-    # Calculate time offset from Iridium
-    if iridium_dt:
-        time_offset = (iridium_dt - datetime.now()).total_seconds()
+    # Calculate time offset from Iridium. Iridium timestamps are logged in
+    # UTC; the system clock fallback logs local time as before
+    if iridium_ns:
+        offset_ns = iridium_ns - time.time_ns()
         using_iridium_time = True
     else:
-        time_offset = 0
+        offset_ns = 0
         using_iridium_time = False
 
     # Open output file FIRST
     print(f"\nLogging to: {output_file}")
 
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    write_errors = []
+    event_count = 0
+    dropped_count = 0
+
     try:
+        # Write header comment
         with open(output_file, 'w') as f:
-            # Write header comment
             f.write(f"# CIER Log - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write(f"# Port: {port} @ {baud_rate} baud\n")
             f.write(f"# Time source: {'Iridium' if using_iridium_time else 'System'}\n")
             f.write("#\n")
-            f.flush()
 
+        # Log lines are appended through a raw fd so each batch goes
+        # straight to the kernel, with no Python-level buffering
+        fd = os.open(output_file, os.O_WRONLY | os.O_APPEND)
+        try:
             # NOW enable CIER mode, right before we start reading
             if not enable_cier(ser):
                 print("  !! Failed to enable CIER mode")
-                ser.close()
                 return False
             print("  OK CIER mode enabled")
 
@@ -362,50 +551,198 @@ def run_logger(port, output_file, baud_rate=19200):
             print("CIER Logger Active - Press Ctrl+C to stop")
             print("=" * 50 + "\n")
 
-            event_count = 0
-            last_time_sync = time.time()
+            # File writes happen on a background thread so an SD card
+            # stall can't hold up serial reads
+            writer = threading.Thread(
+                target=log_writer,
+                args=(fd, log_queue, write_errors),
+                daemon=True
+            )
+            writer.start()
+
+            # Wait on the serial fd directly; epoll wakes us only when
+            # bytes actually arrive
+            ser_fd = ser.fileno()
+            sel = selectors.DefaultSelector()
+            sel.register(ser_fd, selectors.EVENT_READ)
+
+            # Ctrl+C and SIGTERM (e.g. systemd stopping the service) just
+            # write to a pipe that wakes the selector, so shutdown always
+            # starts from the wait rather than partway through a line
+            wake_r, wake_w = os.pipe()
+            os.set_blocking(wake_w, False)
+            sel.register(wake_r, selectors.EVENT_READ)
+            old_wakeup_fd = signal.set_wakeup_fd(wake_w)
+            old_handlers = {
+                sig: signal.signal(sig, lambda signum, frame: None)
+                for sig in (signal.SIGINT, signal.SIGTERM)
+            }
 
-            while True:
-                # Periodically sync time with Iridium (every 5 minutes)
-                if time.time() - last_time_sync > 300:
-                    iridium_dt = get_iridium_time(ser)
-                    if iridium_dt:
-                        time_offset = (iridium_dt - datetime.now()).total_seconds()
-                        using_iridium_time = True
-                    last_time_sync = time.time()
-
-                # Read incoming data
-                if ser.in_waiting:
+            try:
+                last_time_sync_ns = time.monotonic_ns()
+
+                # Bytes are read straight into a fixed buffer; rx[:rx_end] is
+                # unprocessed data, normally nothing or a partial line
+                rx = bytearray(RX_BUFFER_SIZE)
+                rx_view = memoryview(rx)
+                rx_end = 0
+
+                # Timestamps are built from integer ns; the "[YYYY-MM-DD
+                # HH:MM:SS." part only changes once a second, so it's cached
+                time_struct = time.gmtime if using_iridium_time else time.localtime
+                last_sec = None
+                sec_prefix = b""
+
+                def timestamp_prefix():
+                    nonlocal last_sec, sec_prefix
+                    sec, ms = divmod((time.time_ns() + offset_ns) // 1_000_000, 1000)
+                    if sec != last_sec:
+                        last_sec = sec
+                        sec_prefix = time.strftime(
+                            "[%Y-%m-%d %H:%M:%S.", time_struct(sec)
+                        ).encode()
+                    return sec_prefix + b"%03d] " % ms
+
+                def log_events(events):
+                    nonlocal event_count, dropped_count
+
+                    # Queue the whole batch for the writer thread
                     try:
-                        line = ser.readline().decode('ascii', errors='ignore').strip()
-                    except:
-                        continue
-
-                    if not line:
+                        log_queue.put_nowait(events)
+                        event_count += len(events)
+                    except queue.Full:
+                        dropped_count += len(events)
+
+                    # Display to console
+                    sys.stdout.write(b"".join(events).decode())
+                    sys.stdout.flush()
+
+                def log_unsolicited(line):
+                    log_events([timestamp_prefix() + line.encode() + b"\n"])
+
+                # Set once a signal arrives: when to give up on in-flight data
+                stop_deadline_ns = None
+
+                while True:
+                    if write_errors:
+                        raise write_errors[0]
+
+                    now_ns = time.monotonic_ns()
+                    if stop_deadline_ns is not None:
+                        # Stopping: log what the modem has already sent,
+                        # waiting briefly for the rest of a partial line
+                        if now_ns >= stop_deadline_ns:
+                            raise KeyboardInterrupt
+                        timeout = (stop_deadline_ns - now_ns) / 1_000_000_000 if rx_end else 0
+                    else:
+                        # Periodically sync time with Iridium (every 5
+                        # minutes). Only between lines, so the command
+                        # response can't land in the middle of a partly
+                        # received event; events that arrive while waiting
+                        # for it are still logged, and a signal cuts it short
+                        sync_due_ns = last_time_sync_ns + TIME_SYNC_INTERVAL_NS
+                        if not rx_end and now_ns >= sync_due_ns:
+                            iridium_ns = get_iridium_time(
+                                ser, on_unsolicited=log_unsolicited, interrupt_fd=wake_r
+                            )
+                            if iridium_ns:
+                                offset_ns = iridium_ns - time.time_ns()
+                                time_struct = time.gmtime
+                                last_sec = None
+                                using_iridium_time = True
+                            last_time_sync_ns = time.monotonic_ns()
+                            continue
+
+                        # Sleep until the port is readable or the resync is
+                        # due. A pending partial line defers the resync, so
+                        # in that case just wait for the rest of it
+                        timeout = None if rx_end else (sync_due_ns - now_ns) / 1_000_000_000
+
+                    serial_ready = False
+                    for key, _ in sel.select(timeout):
+                        if key.fd == wake_r:
+                            os.read(wake_r, 512)
+                            if stop_deadline_ns is None:
+                                stop_deadline_ns = time.monotonic_ns() + SHUTDOWN_DRAIN_NS
+                        else:
+                            serial_ready = True
+
+                    if not serial_ready:
+                        # Once stopping and nothing is left in flight, stop
+                        # the same way as a Ctrl+C outside the loop
+                        if stop_deadline_ns is not None and not rx_end:
+                            raise KeyboardInterrupt
                         continue
 
-                    # Calculate current timestamp
-                    current_time = datetime.now() + timedelta(seconds=time_offset)
-                    timestamp = current_time.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+                    # A full buffer means no newline in RX_BUFFER_SIZE bytes
+                    if rx_end == RX_BUFFER_SIZE:
+                        rx_end = 0
 
-                    # Log all CIEV events
-                    if line.startswith("+CIEV:"):
-                        event_count += 1
-
-                        # Write timestamped line to log
-                        log_line = f"[{timestamp}] {line}"
-                        f.write(log_line + "\n")
-                        f.flush()
-
-                        # Display to console
-                        print(log_line)
+                    # Drain everything the UART has buffered in one read,
+                    # straight from the fd into the free end of the buffer
+                    try:
+                        count = os.readv(ser_fd, [rx_view[rx_end:]])
+                    except BlockingIOError:
+                        continue
+                    except OSError as e:
+                        raise serial.SerialException(f"read failed: {e}")
+
+                    if not count:
+                        raise serial.SerialException("device disconnected")
+                    rx_end += count
+
+                    # Pick out complete CIEV lines. The prefix is checked in
+                    # place, so other modem output is never copied or decoded
+                    lines = []
+                    line_start = 0
+                    newline = rx.find(b'\n', 0, rx_end)
+                    while newline >= 0:
+                        if rx.startswith(CIEV_PREFIX, line_start, newline):
+                            lines.append(rx[line_start:newline])
+                        line_start = newline + 1
+                        newline = rx.find(b'\n', line_start, rx_end)
+
+                    # Move any partial trailing line to the front
+                    rx_end -= line_start
+                    if line_start and rx_end:
+                        rx_view[:rx_end] = rx_view[line_start:line_start + rx_end]
+
+                    if not lines:
+                        continue
 
-                else:
-                    time.sleep(0.01)
+                    # Log all CIEV events, with one timestamp per drain -
+                    # lines in a burst arrived together
+                    log_events(format_events(lines, timestamp_prefix()))
+
+            finally:
+                signal.set_wakeup_fd(old_wakeup_fd)
+                for sig, handler in old_handlers.items():
+                    signal.signal(sig, handler)
+                sel.close()
+                os.close(wake_r)
+                os.close(wake_w)
+
+                # Let the writer drain what's queued before the file closes.
+                # A failure in that last write still goes out through the
+                # IOError handler below, with no event total reported
+                if writer.is_alive():
+                    log_queue.put(None)
+                writer.join()
+                if write_errors:
+                    raise write_errors[0]
+
+        finally:
+            os.close(fd)
 
     except KeyboardInterrupt:
         print(f"\n\nStopping logger...")
         print(f"Total events logged: {event_count}")
+        if dropped_count:
+            print(f"!! {dropped_count} events dropped (log writer fell behind)")
+
+    except serial.SerialException as e:
+        print(f"\nERROR: Serial port failed: {e}")
+        return False
 
     except IOError as e:
         print(f"\nERROR: Could not write to file: {e}")
@@ -414,8 +751,11 @@ def run_logger(port, output_file, baud_rate=19200):
     finally:
         # Disable CIER mode
         print("Disabling CIER mode...")
-        send_command(ser, "AT+CIER=0")
-        ser.close()
+        try:
+            send_command(ser, "AT+CIER=0")
+        except (serial.SerialException, termios.error):
+            print("  !! Could not disable CIER mode (serial port unavailable)")
+        close_port(ser, low_latency)
         print(f"Log saved to: {output_file}")
 
     return True